@@ -1,689 +1,1044 @@
-import streamlit as st
-import json
-import os
-from datetime import datetime
-import pandas as pd
-import numpy as np
-
-# ---------- CONFIG ----------
-st.set_page_config(
-    page_title="Meme Coin Launch Studio",
-    page_icon="💊",
-    layout="wide"
-)
-
-IDEAS_FILE = "ideas.json"
-
-
-# ---------- PERSISTENCE HELPERS ----------
-def load_ideas():
-    if not os.path.exists(IDEAS_FILE):
-        return []
-    try:
-        with open(IDEAS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    except json.JSONDecodeError:
-        return []
-
-
-def save_ideas(ideas):
-    with open(IDEAS_FILE, "w", encoding="utf-8") as f:
-        json.dump(ideas, f, ensure_ascii=False, indent=2)
-
-
-# ---------- SCORING / RATING ----------
-def rate_score(score: int) -> str:
-    if score >= 32:
-        return "S‑Tier"
-    elif score >= 28:
-        return "A‑Tier"
-    elif score >= 22:
-        return "B‑Tier"
-    else:
-        return "Weak"
-
-
-def tier_description(tier: str) -> str:
-    if tier == "S‑Tier":
-        return "Launch immediately, double down on narrative and distribution."
-    elif tier == "A‑Tier":
-        return "Strong – refine weak spots, then launch."
-    elif tier == "B‑Tier":
-        return "Mid – iterate hard on meme and social energy."
-    else:
-        return "Do not launch yet – rework the core concept."
-
-
-def compute_meme_readiness(scores: dict) -> int:
-    # scores is dict of 8 criteria (0–5)
-    mf = scores["Concept Clarity"] + scores["Remixability"] + scores["Cultural Bandwidth"]
-    se = scores["Reply‑Bait Potential"] + scores["Conflict / Tension"] + scores["Status Signaling"]
-    aa = scores["Narrative Hook"] + scores["Character / Symbol Strength"]
-
-    # Normalize each bucket to 0–1
-    mf_norm = mf / 15
-    se_norm = se / 15
-    aa_norm = aa / 10
-
-    readiness = 0.4 * se_norm + 0.3 * mf_norm + 0.3 * aa_norm
-    return int(round(readiness * 100))
-
-
-# ---------- HEURISTIC AUTO‑SCORING ----------
-def heuristic_auto_score(name: str, narrative: str) -> dict:
-    """
-    Rough, rule‑based scoring to reduce your own bias.
-    It looks at length, presence of conflict words, etc.
-    Not AI, but a consistent heuristic.
-    """
-
-    text = (name + " " + narrative).lower()
-    length = len(narrative)
-
-    def clamp(x, lo=0, hi=5):
-        return max(lo, min(hi, x))
-
-    # Concept clarity: short, focused narratives get higher score
-    if length < 60:
-        concept_clarity = 2
-    elif length < 250:
-        concept_clarity = 4
-    else:
-        concept_clarity = 3
-    if any(k in text for k in ["coin for", "this coin is for", "official coin of"]):
-        concept_clarity += 1
-
-    # Remixability: presence of archetypes / universal roles
-    remix_words = ["dev", "developer", "applicant", "visa", "whale", "union",
-                   "boss", "founder", "worker", "student", "rejected", "hiring"]
-    remixability = 2 + sum(w in text for w in remix_words)
-    remixability = clamp(remixability)
-
-    # Cultural bandwidth: global pains and simple concepts
-    global_pain_words = ["visa", "job", "salary", "boss", "tax", "rent", "queue",
-                         "rejected", "ghosted", "work", "burnout"]
-    cb_score = 2 + sum(w in text for w in global_pain_words)
-    cultural_bandwidth = clamp(cb_score)
-
-    # Reply‑bait: confession / story prompts
-    reply_words = ["story", "confession", "share", "reply", "tell", "chat"]
-    reply_bait = 2 + sum(w in text for w in reply_words)
-    reply_bait = clamp(reply_bait)
-
-    # Conflict / tension: enemies and versus framing
-    conflict_words = ["boss", "founder", "hr", "ats", "embassy", "government",
-                      "landlord", "system", "rejected", "ghosted", "underpaid"]
-    conflict_tension = 1 + sum(w in text for w in conflict_words)
-    conflict_tension = clamp(conflict_tension)
-
-    # Status signaling: identity groups
-    status_words = ["dev", "developer", "applicant", "founder", "immigrant",
-                    "worker", "survivor", "union", "community"]
-    status_signaling = 2 + sum(w in text for w in status_words)
-    status_signaling = clamp(status_signaling)
-
-    # Narrative hook: if we can see a clear headline
-    hook_words = ["finally", "official", "revolution", "union", "survivor",
-                  "economy", "queue", "launch", "token"]
-    narrative_hook = 2 + sum(w in text for w in hook_words)
-    narrative_hook = clamp(narrative_hook)
-
-    # Character / symbol strength: obvious mascots
-    symbol_words = ["turtle", "whale", "ghost", "cop", "battery", "butt",
-                    "applicant", "dev", "robot", "queue"]
-    character_strength = 2 + sum(w in text for w in symbol_words)
-    character_strength = clamp(character_strength)
-
-    scores = {
-        "Concept Clarity": clamp(concept_clarity),
-        "Remixability": remixability,
-        "Cultural Bandwidth": cultural_bandwidth,
-        "Reply‑Bait Potential": reply_bait,
-        "Conflict / Tension": conflict_tension,
-        "Status Signaling": status_signaling,
-        "Narrative Hook": narrative_hook,
-        "Character / Symbol Strength": character_strength,
-    }
-    return scores
-
-
-# ---------- DESCRIPTION GENERATOR ----------
-def generate_pumpfun_descriptions(name: str, ticker: str, narrative: str):
-    base = narrative.strip()
-    if not base:
-        base = f"{name} is a degen little experiment."
-
-    short = f"{name} ({ticker}) – {base[:160]}"
-
-    funny = (
-        f"{name} ({ticker})\n\n"
-        f"{base}\n\n"
-        "You probably won’t get rich, but at least you’ll finally have a coin that understands your pain."
-    )
-
-    emotional = (
-        f"{name} ({ticker}) is for everyone who feels this story in their bones.\n\n"
-        f"{base}\n\n"
-        "If this sounds like your life, you’re already early."
-    )
-
-    aggressive = (
-        f"{name} ({ticker}) exists because nobody else fixed this.\n\n"
-        f"{base}\n\n"
-        "If you’re tired of being ignored, underpaid, or ghosted – buy and make noise."
-    )
-
-    long = (
-        f"{name} ({ticker})\n\n"
-        f"{base}\n\n"
-        "This isn’t financial advice. This is emotional damage tokenized.\n"
-        "Reply with your story in the thread and join the chaos."
-    )
-
-    return {
-        "Short": short,
-        "Funny": funny,
-        "Emotional": emotional,
-        "Aggressive": aggressive,
-        "Long": long,
-    }
-
-
-# ---------- MASCOT SUGGESTION GENERATOR ----------
-def generate_mascot_suggestions(name: str, narrative: str):
-    text = (name + " " + narrative).lower()
-    ideas = []
-
-    if any(word in text for word in ["applicant", "reject", "cv", "job", "ats"]):
-        ideas.append("A small character holding a crumpled CV with a big RED 'REJECTED' stamp on their forehead.")
-        ideas.append("A walking email envelope with sad eyes and a giant 'We went with another candidate' preview line.")
-    if any(word in text for word in ["dev", "developer", "code", "bug", "feature", "sprint"]):
-        ideas.append("Exhausted developer with red eyes, hoodie, laptop, and a pizza slice shaped like a middle finger.")
-        ideas.append("Pixel‑art dev sitting on a stack of bug reports with coffee IV drip.")
-    if any(word in text for word in ["visa", "queue", "embassy", "passport"]):
-        ideas.append("A long snake‑like queue of tiny characters, one waving a passport and looking exhausted.")
-        ideas.append("A passport character stuck inside an hourglass with sand running out.")
-    if any(word in text for word in ["burnout", "tired", "exhausted", "caffeine", "coffee"]):
-        ideas.append("Human‑shaped battery at 3% charge, plugged into a coffee mug like a power adapter.")
-    if any(word in text for word in ["butt", "ass"]):
-        ideas.append("A cartoon butt with a tiny bandage and a 'Work Broke Me' tattoo.")
-    if not ideas:
-        ideas.append("Pick a simple archetype: worker, applicant, ghost, cop, turtle, whale – then exaggerate it hard.")
-        ideas.append("Design a mascot that could be drawn in 4–5 simple shapes so people can easily remix it.")
-
-    emojis = []
-    if "visa" in text or "queue" in text:
-        emojis = ["🛂", "🧳", "⏳"]
-    elif "dev" in text:
-        emojis = ["👨‍💻", "👩‍💻", "☕"]
-    elif "reject" in text:
-        emojis = ["📩", "❌", "💔"]
-    elif "burnout" in text:
-        emojis = ["🔋", "😵‍💫", "☕"]
-    else:
-        emojis = ["🧠", "🔥", "🎭"]
-
-    return ideas, emojis
-
-
-# ---------- SESSION STATE ----------
-if "ideas" not in st.session_state:
-    st.session_state.ideas = load_ideas()
-
-
-def find_idea_by_name(name: str):
-    for idea in st.session_state.ideas:
-        if idea["name"].strip().lower() == name.strip().lower():
-            return idea
-    return None
-
-
-# ---------- LAYOUT: TABS ----------
-st.title("💊 Meme Coin Launch Studio")
-st.caption("Score, store, compare, and prepare degen‑ready meme coins with a 40‑point model + launch tools.")
-
-tabs = st.tabs([
-    "Score Idea",
-    "Idea Vault",
-    "Comparison Dashboard",
-    "Launch Checklist",
-    "Generators",
-    "Settings",
-])
-
-# ---------- TAB 1: SCORE IDEA ----------
-with tabs[0]:
-    st.header("Score a meme coin idea")
-
-    col_left, col_right = st.columns([2, 1])
-
-    with col_left:
-        st.subheader("Idea details")
-
-        idea_name = st.text_input("Idea name", placeholder="e.g., Rejected Applicant Coin")
-        ticker = st.text_input("Ticker", placeholder="e.g., $REKTAPP")
-        narrative = st.text_area(
-            "Core narrative (1–3 paragraphs)",
-            placeholder="Describe the story, pain, or joke behind this coin.",
-            height=200,
-        )
-
-        auto_mode = st.checkbox("Auto‑score this idea (reduce manual bias)", value=True)
-        st.caption("You can still adjust scores manually if you want fine‑tuning.")
-
-    with col_right:
-        st.subheader("Optional: load existing idea")
-        all_names = [idea["name"] for idea in st.session_state.ideas]
-        if all_names:
-            selected_existing = st.selectbox("Load idea from vault", ["None"] + all_names)
-            if selected_existing != "None":
-                existing = find_idea_by_name(selected_existing)
-                if existing:
-                    if st.button("Load selected idea here"):
-                        idea_name = existing["name"]
-                        ticker = existing.get("ticker", "")
-                        narrative = existing.get("narrative", "")
-                        st.experimental_rerun()
-
-    st.markdown("---")
-
-    # Auto or manual scores
-    if auto_mode:
-        scores = heuristic_auto_score(idea_name, narrative)
-    else:
-        scores = {
-            "Concept Clarity": 3,
-            "Remixability": 3,
-            "Cultural Bandwidth": 3,
-            "Reply‑Bait Potential": 3,
-            "Conflict / Tension": 3,
-            "Status Signaling": 3,
-            "Narrative Hook": 3,
-            "Character / Symbol Strength": 3,
-        }
-
-    # Show sliders with prefilled scores (for optional tweak)
-    st.subheader("Scoring (0–5 per criterion)")
-    st.caption("Adjust only if you strongly disagree with the auto‑score.")
-
-    cols = st.columns(2)
-    with cols[0]:
-        scores["Concept Clarity"] = st.slider(
-            "Concept Clarity – Understandable in 3 seconds?",
-            0, 5, scores["Concept Clarity"],
-        )
-        scores["Remixability"] = st.slider(
-            "Remixability – Easy to create variations and running jokes?",
-            0, 5, scores["Remixability"],
-        )
-        scores["Cultural Bandwidth"] = st.slider(
-            "Cultural Bandwidth – Works across countries and cultures?",
-            0, 5, scores["Cultural Bandwidth"],
-        )
-        scores["Reply‑Bait Potential"] = st.slider(
-            "Reply‑Bait Potential – Naturally invites replies, stories, cope?",
-            0, 5, scores["Reply‑Bait Potential"],
-        )
-    with cols[1]:
-        scores["Conflict / Tension"] = st.slider(
-            "Conflict / Tension – Clear ‘versus’ dynamic?",
-            0, 5, scores["Conflict / Tension"],
-        )
-        scores["Status Signaling"] = st.slider(
-            "Status Signaling – Says something about the holder?",
-            0, 5, scores["Status Signaling"],
-        )
-        scores["Narrative Hook"] = st.slider(
-            "Narrative Hook – Strong one‑liner potential?",
-            0, 5, scores["Narrative Hook"],
-        )
-        scores["Character / Symbol Strength"] = st.slider(
-            "Character / Symbol Strength – Strong icon, mascot, or symbol?",
-            0, 5, scores["Character / Symbol Strength"],
-        )
-
-    total_score = sum(scores.values())
-    tier = rate_score(total_score)
-    tier_text = tier_description(tier)
-    readiness = compute_meme_readiness(scores)
-
-    st.markdown("---")
-    st.subheader("Results")
-
-    col_a, col_b, col_c = st.columns(3)
-    with col_a:
-        st.metric("Total score", f"{total_score} / 40")
-    with col_b:
-        st.metric("Tier", tier)
-    with col_c:
-        st.metric("Meme‑readiness", f"{readiness} / 100")
-
-    st.write(tier_text)
-
-    with st.expander("See detailed breakdown"):
-        for k, v in scores.items():
-            st.write(f"- **{k}:** {v} / 5")
-
-    # Suggestions
-    st.subheader("Suggestions based on weak dimensions")
-    weak_dims = [k for k, v in scores.items() if v <= 2]
-    if not weak_dims:
-        st.write("This idea looks structurally solid. Focus on launch timing, distribution, and execution.")
-    else:
-        for dim in weak_dims:
-            if dim == "Concept Clarity":
-                st.write("- **Concept Clarity:** Reduce your narrative to one brutal, obvious sentence anyone can repeat.")
-            elif dim == "Remixability":
-                st.write("- **Remixability:** Design 5+ meme formats, screenshots, or rituals people can reuse easily.")
-            elif dim == "Cultural Bandwidth":
-                st.write("- **Cultural Bandwidth:** Swap niche references for universal pains (money, work, rejection, bureaucracy).")
-            elif dim == "Reply‑Bait Potential":
-                st.write("- **Reply‑Bait Potential:** Add confession prompts, screenshot prompts, or pain‑sharing prompts to the story.")
-            elif dim == "Conflict / Tension":
-                st.write("- **Conflict / Tension:** Introduce a clear villain: boss, system, whale, embassy, landlord, etc.")
-            elif dim == "Status Signaling":
-                st.write("- **Status Signaling:** Make holding the coin signal identity (dev, applicant, survivor, degen, etc.).")
-            elif dim == "Narrative Hook":
-                st.write("- **Narrative Hook:** Write 5 fake headlines until one feels viral and punchy.")
-            elif dim == "Character / Symbol Strength":
-                st.write("- **Character / Symbol Strength:** Attach a simple, iconic mascot people can draw, screenshot, and spam.")
-
-    st.markdown("---")
-    st.subheader("Save this idea to your vault")
-
-    notes = st.text_area(
-        "Notes (optional)",
-        placeholder="Launch thoughts, variations to test, influencer angles, etc.",
-        height=120,
-    )
-
-    if st.button("Save / Update Idea"):
-        if not idea_name:
-            st.warning("You need at least an idea name to save.")
-        else:
-            timestamp = datetime.utcnow().isoformat() + "Z"
-            new_entry = {
-                "name": idea_name,
-                "ticker": ticker,
-                "narrative": narrative,
-                "scores": scores,
-                "total_score": total_score,
-                "tier": tier,
-                "meme_readiness": readiness,
-                "notes": notes,
-                "timestamp": timestamp,
-                "checklist": {},  # will be filled in Launch Checklist tab
-            }
-
-            # Update or append
-            updated = False
-            for i, idea in enumerate(st.session_state.ideas):
-                if idea["name"].strip().lower() == idea_name.strip().lower():
-                    st.session_state.ideas[i] = {
-                        **idea,
-                        **new_entry,
-                        "checklist": idea.get("checklist", {}),
-                    }
-                    updated = True
-                    break
-            if not updated:
-                st.session_state.ideas.append(new_entry)
-
-            save_ideas(st.session_state.ideas)
-            st.success("Idea saved / updated in vault.")
-
-
-# ---------- TAB 2: IDEA VAULT ----------
-with tabs[1]:
-    st.header("Idea vault")
-
-    ideas = st.session_state.ideas
-    if not ideas:
-        st.info("No ideas saved yet. Use the 'Score Idea' tab to add one.")
-    else:
-        df = pd.DataFrame([
-            {
-                "Name": idea["name"],
-                "Ticker": idea.get("ticker", ""),
-                "Total Score": idea.get("total_score", 0),
-                "Tier": idea.get("tier", ""),
-                "Meme Readiness": idea.get("meme_readiness", 0),
-                "Saved At": idea.get("timestamp", ""),
-            }
-            for idea in ideas
-        ])
-        df_sorted = df.sort_values(by="Total Score", ascending=False).reset_index(drop=True)
-        st.dataframe(df_sorted, use_container_width=True)
-
-        st.markdown("#### Clone or edit an idea")
-        selected_name = st.selectbox("Select idea", df_sorted["Name"].tolist())
-        selected_idea = find_idea_by_name(selected_name)
-
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("Load into Score tab"):
-                st.session_state["load_name"] = selected_name
-                st.info("Go back to 'Score Idea' tab and use the dropdown to load it.")
-            if st.button("Clone idea"):
-                if selected_idea:
-                    clone = selected_idea.copy()
-                    clone["name"] = selected_idea["name"] + " (Clone)"
-                    clone["timestamp"] = datetime.utcnow().isoformat() + "Z"
-                    st.session_state.ideas.append(clone)
-                    save_ideas(st.session_state.ideas)
-                    st.success("Idea cloned.")
-        with col2:
-            if st.button("Delete idea"):
-                st.session_state.ideas = [i for i in st.session_state.ideas if i["name"] != selected_name]
-                save_ideas(st.session_state.ideas)
-                st.success("Idea deleted.")
-                st.experimental_rerun()
-
-        st.markdown("#### Edit notes for selected idea")
-        if selected_idea:
-            current_notes = selected_idea.get("notes", "")
-            updated_notes = st.text_area(
-                "Notes",
-                value=current_notes,
-                height=150,
-            )
-            if st.button("Save notes"):
-                for i, idea in enumerate(st.session_state.ideas):
-                    if idea["name"] == selected_name:
-                        st.session_state.ideas[i]["notes"] = updated_notes
-                        break
-                save_ideas(st.session_state.ideas)
-                st.success("Notes updated.")
-
-        # Download
-        csv = df_sorted.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            label="⬇️ Download vault as CSV",
-            data=csv,
-            file_name="meme_coin_ideas_vault.csv",
-            mime="text/csv",
-        )
-
-
-# ---------- TAB 3: COMPARISON DASHBOARD ----------
-with tabs[2]:
-    st.header("Comparison dashboard")
-
-    ideas = st.session_state.ideas
-    if len(ideas) < 2:
-        st.info("Save at least two ideas to compare them.")
-    else:
-        names = [i["name"] for i in ideas]
-        selected_names = st.multiselect("Select ideas to compare", names, default=names[:3])
-
-        selected_ideas = [i for i in ideas if i["name"] in selected_names]
-
-        if selected_ideas:
-            comp_df = pd.DataFrame([
-                {
-                    "Name": i["name"],
-                    "Total Score": i.get("total_score", 0),
-                    "Meme Readiness": i.get("meme_readiness", 0),
-                }
-                for i in selected_ideas
-            ])
-            st.subheader("Total score vs meme‑readiness")
-            st.bar_chart(comp_df.set_index("Name"))
-
-            # Radar: 8 dimensions
-            st.subheader("Criteria breakdown (radar‑style table)")
-
-            crit_names = [
-                "Concept Clarity",
-                "Remixability",
-                "Cultural Bandwidth",
-                "Reply‑Bait Potential",
-                "Conflict / Tension",
-                "Status Signaling",
-                "Narrative Hook",
-                "Character / Symbol Strength",
-            ]
-
-            radar_data = []
-            for i in selected_ideas:
-                row = {"Name": i["name"]}
-                sc = i.get("scores", {})
-                for c in crit_names:
-                    row[c] = sc.get(c, 0)
-                radar_data.append(row)
-
-            radar_df = pd.DataFrame(radar_data)
-            st.dataframe(radar_df.set_index("Name"), use_container_width=True)
-
-            st.subheader("Tier distribution")
-            all_df = pd.DataFrame([
-                {"Name": i["name"], "Tier": i.get("tier", "Unknown")}
-                for i in ideas
-            ])
-            tier_counts = all_df["Tier"].value_counts()
-            st.bar_chart(tier_counts)
-
-
-# ---------- TAB 4: LAUNCH CHECKLIST ----------
-with tabs[3]:
-    st.header("Launch checklist")
-
-    ideas = st.session_state.ideas
-    if not ideas:
-        st.info("Save at least one idea first.")
-    else:
-        name_for_checklist = st.selectbox(
-    "Select idea",
-    [i["name"] for i in ideas],
-    key="checklist_select"
-)
-
-        idea = find_idea_by_name(name_for_checklist)
-
-        if idea:
-            default_checklist = {
-                "Narrative finalized": False,
-                "Mascot selected": False,
-                "Reply rituals defined": False,
-                "First 10 posts drafted": False,
-                "Pump.fun description ready": False,
-                "Meme templates created": False,
-                "Launch timing decided": False,
-                "Seeding / influencer plan": False,
-                "Pinned post / announcement ready": False,
-            }
-            cl = idea.get("checklist", {})
-            # merge with defaults
-            for k, v in default_checklist.items():
-                cl.setdefault(k, v)
-
-            st.subheader(f"Checklist for {name_for_checklist}")
-            new_cl = {}
-            cols = st.columns(2)
-            items = list(cl.items())
-            half = len(items) // 2 + len(items) % 2
-
-            with cols[0]:
-                for k, v in items[:half]:
-                    new_cl[k] = st.checkbox(k, value=v)
-            with cols[1]:
-                for k, v in items[half:]:
-                    new_cl[k] = st.checkbox(k, value=v)
-
-            if st.button("Save checklist"):
-                for i, obj in enumerate(st.session_state.ideas):
-                    if obj["name"] == name_for_checklist:
-                        st.session_state.ideas[i]["checklist"] = new_cl
-                        break
-                save_ideas(st.session_state.ideas)
-                st.success("Checklist updated.")
-
-
-# ---------- TAB 5: GENERATORS ----------
-with tabs[4]:
-    st.header("Generators")
-
-    ideas = st.session_state.ideas
-    col_gen1, col_gen2 = st.columns(2)
-
-    with col_gen1:
-        st.subheader("Pump.fun description generator")
-        source_idea_name = st.selectbox(
-            "Select idea for description",
-            ["Custom narrative"] + [i["name"] for i in ideas],
-        )
-
-        if source_idea_name == "Custom narrative":
-            d_name = st.text_input("Idea name (for description)", "")
-            d_ticker = st.text_input("Ticker (for description)", "")
-            d_narr = st.text_area("Narrative", "", height=150)
-        else:
-            idea = find_idea_by_name(source_idea_name)
-            d_name = idea["name"]
-            d_ticker = idea.get("ticker", "")
-            d_narr = idea.get("narrative", "")
-
-        if st.button("Generate descriptions"):
-            descs = generate_pumpfun_descriptions(d_name, d_ticker, d_narr)
-            for k, v in descs.items():
-                st.markdown(f"**{k} version:**")
-                st.code(v)
-
-    with col_gen2:
-        st.subheader("Mascot suggestion generator")
-        source_mascot_name = st.selectbox(
-            "Select idea for mascot",
-            ["Custom"] + [i["name"] for i in ideas],
-        )
-
-        if source_mascot_name == "Custom":
-            m_name = st.text_input("Idea name (for mascot)", "")
-            m_narr = st.text_area("Narrative (for mascot)", "", height=150)
-        else:
-            idea = find_idea_by_name(source_mascot_name)
-            m_name = idea["name"]
-            m_narr = idea.get("narrative", "")
-
-        if st.button("Generate mascot suggestions"):
-            concepts, emojis = generate_mascot_suggestions(m_name, m_narr)
-            st.markdown("**Concept ideas:**")
-            for c in concepts:
-                st.write(f"- {c}")
-            st.markdown("**Emoji palette ideas:**")
-            st.write(" ".join(emojis))
-
-
-# ---------- TAB 6: SETTINGS ----------
-with tabs[5]:
-    st.header("Settings")
-
-    st.write("Manage stored data and basic configuration.")
-
-    if st.button("Reset vault (delete all ideas)"):
-        st.warning("This will delete all saved ideas and cannot be undone.")
-        st.session_state.ideas = []
-        save_ideas([])
-        st.success("Vault cleared. Restart the app to see it empty.")
-
-    st.write("Ideas are stored locally in `ideas.json` in the same folder as this script.")
+import streamlit as st
+import json
+import os
+import re
+import time
+from bisect import bisect_right
+from functools import cache, lru_cache
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+from types import MappingProxyType
+
+# pandas is imported lazily inside the blocks that need it: its import
+# alone costs hundreds of ms of cold-start time, and an empty vault
+# never touches it.
+import numpy as np
+
+# ---------- CONFIG ----------
+st.set_page_config(
+    page_title="Meme Coin Launch Studio",
+    page_icon="💊",
+    layout="wide"
+)
+
+IDEAS_FILE = "ideas.jsonl"
+LEGACY_IDEAS_FILE = "ideas.json"
+
+
+# ---------- PERSISTENCE HELPERS ----------
+def utc_timestamp() -> str:
+    # Formats straight from the epoch without constructing a datetime
+    # object; the ISO-8601 Z strings sort lexicographically in time order.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _dump_line(entry) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(entry) + b"\n"
+    # Compact separators to match orjson's output – default stdlib
+    # separators pad every delimiter with a space.
+    return (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def _load_ideas_cached(path: str, mtime: float):
+    # mtime is only part of the cache key: a newer file invalidates the entry.
+    # Updates are appended as new versions of an entry (log-structured),
+    # so dedupe by normalized name keeping the newest line; dict insertion
+    # order preserves each idea's original position in the vault.
+    loads = orjson.loads if _HAS_ORJSON else json.loads
+    by_key = {}
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return []
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = loads(line)
+                key = entry.get("_key") or entry["name"].strip().lower()
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # A torn or corrupt line only loses itself; the rest of
+                # the vault stays readable.
+                continue
+            by_key[key] = entry
+    return list(by_key.values())
+
+
+def _load_legacy_ideas(path: str):
+    # Stream-parse big legacy files so migration doesn't hold the whole
+    # document in memory at once; small files keep the fast one-shot path.
+    if os.path.getsize(path) > 1_000_000:
+        try:
+            import ijson
+        except ImportError:
+            pass
+        else:
+            with open(path, "rb") as f:
+                try:
+                    return list(ijson.items(f, "item"))
+                except ijson.JSONError as exc:
+                    # ijson's error doesn't subclass ValueError like the
+                    # json/orjson ones do; normalize it so load_ideas'
+                    # corrupt-file handling covers this path too.
+                    raise ValueError(str(exc)) from exc
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+
+def load_ideas():
+    # Single stat per call: getmtime doubles as the existence check and
+    # the cache key, so an unchanged vault costs one stat, zero reads.
+    try:
+        mtime = os.path.getmtime(IDEAS_FILE)
+    except OSError:
+        pass
+    else:
+        return _load_ideas_cached(IDEAS_FILE, mtime)
+    if os.path.exists(LEGACY_IDEAS_FILE):
+        # One-time migration from the old single-document ideas.json format.
+        try:
+            data = _load_legacy_ideas(LEGACY_IDEAS_FILE)
+        except (json.JSONDecodeError, ValueError):
+            return []
+        ideas = data if isinstance(data, list) else []
+        rewrite_ideas(ideas)
+        return ideas
+    return []
+
+
+def append_idea(entry):
+    # New ideas and updated versions only cost one line of disk IO, not
+    # a full-vault rewrite; the loader keeps the newest line per idea.
+    # If a previous append was torn (crash/disk-full left no trailing
+    # newline), start on a fresh line so the bad line stays isolated
+    # instead of swallowing this entry too.
+    with open(IDEAS_FILE, "a+b") as f:
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(_dump_line(entry))
+
+
+def rewrite_ideas(ideas):
+    # Full rewrite is only needed for deletes/reset, which also compact
+    # away any stale appended versions.
+    # Write to a tempfile and os.replace it so a crash mid-write can
+    # never leave a truncated vault behind.
+    tmp = IDEAS_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        for entry in ideas:
+            f.write(_dump_line(entry))
+    os.replace(tmp, IDEAS_FILE)
+
+
+# ---------- SCORING / RATING ----------
+_TIER_THRESHOLDS = (22, 28, 32)
+_TIERS = ("Weak", "B‑Tier", "A‑Tier", "S‑Tier")
+_TIER_DESCRIPTIONS = {
+    "S‑Tier": "Launch immediately, double down on narrative and distribution.",
+    "A‑Tier": "Strong – refine weak spots, then launch.",
+    "B‑Tier": "Mid – iterate hard on meme and social energy.",
+    "Weak": "Do not launch yet – rework the core concept.",
+}
+
+
+@cache
+def rate_score(score: int) -> str:
+    return _TIERS[bisect_right(_TIER_THRESHOLDS, score)]
+
+
+# Read-only starter presets, built once at import and shared across all
+# reruns; MappingProxyType keeps UI code from mutating them.
+SAMPLE_IDEAS = MappingProxyType({
+    "Rejected Applicant Coin": {
+        "ticker": "$REKTAPP",
+        "narrative": (
+            "The official coin of everyone who sent 300 applications, aced the "
+            "take-home, and still got the 'we went with another candidate' email. "
+            "Every holder is a survivor of the ATS black hole."
+        ),
+    },
+    "Visa Queue Coin": {
+        "ticker": "$QUEUE",
+        "narrative": (
+            "A coin for everyone stuck refreshing an embassy appointment page at "
+            "3am. The queue never moves, the fees never shrink, but at least now "
+            "the waiting room has a token."
+        ),
+    },
+    "Burnout Battery Coin": {
+        "ticker": "$3PCT",
+        "narrative": (
+            "A human-shaped battery permanently at 3% charge, kept alive by "
+            "coffee and deadlines. For every worker who answered Slack messages "
+            "from bed. Recharge not included."
+        ),
+    },
+})
+
+CRITERIA = (
+    "Concept Clarity",
+    "Remixability",
+    "Cultural Bandwidth",
+    "Reply‑Bait Potential",
+    "Conflict / Tension",
+    "Status Signaling",
+    "Narrative Hook",
+    "Character / Symbol Strength",
+)
+
+SUGGESTIONS = {
+    "Concept Clarity": "- **Concept Clarity:** Reduce your narrative to one brutal, obvious sentence anyone can repeat.",
+    "Remixability": "- **Remixability:** Design 5+ meme formats, screenshots, or rituals people can reuse easily.",
+    "Cultural Bandwidth": "- **Cultural Bandwidth:** Swap niche references for universal pains (money, work, rejection, bureaucracy).",
+    "Reply‑Bait Potential": "- **Reply‑Bait Potential:** Add confession prompts, screenshot prompts, or pain‑sharing prompts to the story.",
+    "Conflict / Tension": "- **Conflict / Tension:** Introduce a clear villain: boss, system, whale, embassy, landlord, etc.",
+    "Status Signaling": "- **Status Signaling:** Make holding the coin signal identity (dev, applicant, survivor, degen, etc.).",
+    "Narrative Hook": "- **Narrative Hook:** Write 5 fake headlines until one feels viral and punchy.",
+    "Character / Symbol Strength": "- **Character / Symbol Strength:** Attach a simple, iconic mascot people can draw, screenshot, and spam.",
+}
+
+
+@cache
+def tier_description(tier: str) -> str:
+    return _TIER_DESCRIPTIONS.get(tier, _TIER_DESCRIPTIONS["Weak"])
+
+
+def compute_meme_readiness(scores: dict) -> int:
+    # scores is dict of 8 criteria (0–5)
+    mf = scores["Concept Clarity"] + scores["Remixability"] + scores["Cultural Bandwidth"]
+    se = scores["Reply‑Bait Potential"] + scores["Conflict / Tension"] + scores["Status Signaling"]
+    aa = scores["Narrative Hook"] + scores["Character / Symbol Strength"]
+
+    # Normalize each bucket to 0–1
+    mf_norm = mf / 15
+    se_norm = se / 15
+    aa_norm = aa / 10
+
+    readiness = 0.4 * se_norm + 0.3 * mf_norm + 0.3 * aa_norm
+    return int(round(readiness * 100))
+
+
+def scores_matrix(ideas) -> np.ndarray:
+    # (N, 8) int8 matrix of per-idea scores in CRITERIA order – the
+    # compact SoA layout the batch helpers below operate on.
+    return np.array(
+        [[i.get("scores", {}).get(c, 0) for c in CRITERIA] for i in ideas],
+        dtype=np.int8,
+    )
+
+
+def compute_meme_readiness_batch(scores: np.ndarray, w_se=0.4, w_mf=0.3, w_aa=0.3) -> np.ndarray:
+    # Vectorized counterpart of compute_meme_readiness over an (N, 8)
+    # matrix; one fused pass instead of a Python loop per idea.
+    mf = scores[:, 0:3].sum(axis=1)
+    se = scores[:, 3:6].sum(axis=1)
+    aa = scores[:, 6:8].sum(axis=1)
+    readiness = w_se * se / 15 + w_mf * mf / 15 + w_aa * aa / 10
+    return np.rint(readiness * 100).astype(np.int32)
+
+
+def rate_scores_batch(totals: np.ndarray) -> np.ndarray:
+    return np.select(
+        [totals >= _TIER_THRESHOLDS[2], totals >= _TIER_THRESHOLDS[1], totals >= _TIER_THRESHOLDS[0]],
+        [_TIERS[3], _TIERS[2], _TIERS[1]],
+        default=_TIERS[0],
+    )
+
+
+# ---------- HEURISTIC AUTO‑SCORING ----------
+# Per-bucket keyword frozensets, built once at module load so scoring
+# calls never re-allocate list literals; bucket counts are C-level set
+# intersections against the matched-keyword set.
+_REMIX_WORDS = frozenset({"dev", "developer", "applicant", "visa", "whale", "union",
+                          "boss", "founder", "worker", "student", "rejected", "hiring"})
+_GLOBAL_PAIN_WORDS = frozenset({"visa", "job", "salary", "boss", "tax", "rent", "queue",
+                                "rejected", "ghosted", "work", "burnout"})
+_REPLY_WORDS = frozenset({"story", "confession", "share", "reply", "tell", "chat"})
+_CONFLICT_WORDS = frozenset({"boss", "founder", "hr", "ats", "embassy", "government",
+                             "landlord", "system", "rejected", "ghosted", "underpaid"})
+_STATUS_WORDS = frozenset({"dev", "developer", "applicant", "founder", "immigrant",
+                           "worker", "survivor", "union", "community"})
+_HOOK_WORDS = frozenset({"finally", "official", "revolution", "union", "survivor",
+                         "economy", "queue", "launch", "token"})
+_SYMBOL_WORDS = frozenset({"turtle", "whale", "ghost", "cop", "battery", "butt",
+                           "applicant", "dev", "robot", "queue"})
+
+_ALL_KEYWORDS = (_REMIX_WORDS | _GLOBAL_PAIN_WORDS | _REPLY_WORDS | _CONFLICT_WORDS
+                 | _STATUS_WORDS | _HOOK_WORDS | _SYMBOL_WORDS)
+# One alternation matching every bucket keyword at once, compiled at
+# import; longest-first so e.g. "developer" wins over its "dev" prefix.
+# The optional (?:e?s)? suffix keeps the plural/inflected forms the old
+# substring matching caught for free ("devs", "queues", "taxes").
+_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, sorted(_ALL_KEYWORDS, key=len, reverse=True)))
+    + r")(?:e?s)?\b"
+)
+
+# Substring matching also counted keywords contained in other keywords
+# ("work" in "worker", "dev" in "developer"); precompute that containment
+# once so a match expands to everything the old scan would have found.
+_KEYWORD_EXPAND = {
+    kw: frozenset(k for k in _ALL_KEYWORDS if k in kw) for kw in _ALL_KEYWORDS
+}
+
+
+def _clamp(x, lo=0, hi=5):
+    return max(lo, min(hi, x))
+
+
+@lru_cache(maxsize=128)
+def _prep_text(name: str, narrative: str) -> str:
+    # Shared by scoring and the mascot generator so the same pair is
+    # concatenated and lowercased once, not once per feature.
+    return (name + " " + narrative).lower()
+
+
+@lru_cache(maxsize=256)
+def _auto_score_values(name: str, narrative: str) -> tuple:
+    # Streamlit reruns the script on every widget interaction, so the
+    # same (name, narrative) pair gets scored dozens of times; the cache
+    # stores an immutable tuple in CRITERIA order.
+    text = _prep_text(name, narrative)
+    length = len(narrative)
+
+    # Concept clarity: short, focused narratives get higher score
+    if length < 60:
+        concept_clarity = 2
+    elif length < 250:
+        concept_clarity = 4
+    else:
+        concept_clarity = 3
+    if any(k in text for k in ["coin for", "this coin is for", "official coin of"]):
+        concept_clarity += 1
+
+    # Single scan of the text for every bucket keyword at once, instead
+    # of ~60 independent substring searches re-streaming the narrative.
+    matched = set()
+    for w in _KEYWORD_RE.findall(text):
+        matched |= _KEYWORD_EXPAND[w]
+
+    # Remixability: presence of archetypes / universal roles
+    remixability = _clamp(2 + len(matched & _REMIX_WORDS))
+
+    # Cultural bandwidth: global pains and simple concepts
+    cultural_bandwidth = _clamp(2 + len(matched & _GLOBAL_PAIN_WORDS))
+
+    # Reply‑bait: confession / story prompts
+    reply_bait = _clamp(2 + len(matched & _REPLY_WORDS))
+
+    # Conflict / tension: enemies and versus framing
+    conflict_tension = _clamp(1 + len(matched & _CONFLICT_WORDS))
+
+    # Status signaling: identity groups
+    status_signaling = _clamp(2 + len(matched & _STATUS_WORDS))
+
+    # Narrative hook: if we can see a clear headline
+    narrative_hook = _clamp(2 + len(matched & _HOOK_WORDS))
+
+    # Character / symbol strength: obvious mascots
+    character_strength = _clamp(2 + len(matched & _SYMBOL_WORDS))
+
+    return (
+        _clamp(concept_clarity),
+        remixability,
+        cultural_bandwidth,
+        reply_bait,
+        conflict_tension,
+        status_signaling,
+        narrative_hook,
+        character_strength,
+    )
+
+
+def heuristic_auto_score(name: str, narrative: str) -> dict:
+    """
+    Rough, rule‑based scoring to reduce your own bias.
+    It looks at length, presence of conflict words, etc.
+    Not AI, but a consistent heuristic.
+    """
+    return dict(zip(CRITERIA, _auto_score_values(name, narrative)))
+
+
+# ---------- DESCRIPTION GENERATOR ----------
+@st.cache_data(show_spinner=False)
+def generate_pumpfun_descriptions(name: str, ticker: str, narrative: str):
+    base = narrative.strip()
+    if not base:
+        base = f"{name} is a degen little experiment."
+
+    short = f"{name} ({ticker}) – {base[:160]}"
+
+    funny = (
+        f"{name} ({ticker})\n\n"
+        f"{base}\n\n"
+        "You probably won’t get rich, but at least you’ll finally have a coin that understands your pain."
+    )
+
+    emotional = (
+        f"{name} ({ticker}) is for everyone who feels this story in their bones.\n\n"
+        f"{base}\n\n"
+        "If this sounds like your life, you’re already early."
+    )
+
+    aggressive = (
+        f"{name} ({ticker}) exists because nobody else fixed this.\n\n"
+        f"{base}\n\n"
+        "If you’re tired of being ignored, underpaid, or ghosted – buy and make noise."
+    )
+
+    long = (
+        f"{name} ({ticker})\n\n"
+        f"{base}\n\n"
+        "This isn’t financial advice. This is emotional damage tokenized.\n"
+        "Reply with your story in the thread and join the chaos."
+    )
+
+    return {
+        "Short": short,
+        "Funny": funny,
+        "Emotional": emotional,
+        "Aggressive": aggressive,
+        "Long": long,
+    }
+
+
+# ---------- MASCOT SUGGESTION GENERATOR ----------
+_MASCOT_APPLICANT_WORDS = frozenset({"applicant", "reject", "cv", "job", "ats"})
+_MASCOT_DEV_WORDS = frozenset({"dev", "developer", "code", "bug", "feature", "sprint"})
+_MASCOT_VISA_WORDS = frozenset({"visa", "queue", "embassy", "passport"})
+_MASCOT_BURNOUT_WORDS = frozenset({"burnout", "tired", "exhausted", "caffeine", "coffee"})
+_MASCOT_BUTT_WORDS = frozenset({"butt", "ass"})
+
+# No word boundaries here: several entries are stems ("reject", "dev")
+# that are meant to hit inside longer words like "rejected".
+_MASCOT_KEYWORD_RE = re.compile("|".join(map(re.escape, sorted(
+    _MASCOT_APPLICANT_WORDS | _MASCOT_DEV_WORDS | _MASCOT_VISA_WORDS
+    | _MASCOT_BURNOUT_WORDS | _MASCOT_BUTT_WORDS,
+    key=len, reverse=True,
+))))
+
+
+@st.cache_data(show_spinner=False)
+def generate_mascot_suggestions(name: str, narrative: str):
+    text = _prep_text(name, narrative)
+    matched = set(_MASCOT_KEYWORD_RE.findall(text))
+    ideas = []
+
+    if matched & _MASCOT_APPLICANT_WORDS:
+        ideas.append("A small character holding a crumpled CV with a big RED 'REJECTED' stamp on their forehead.")
+        ideas.append("A walking email envelope with sad eyes and a giant 'We went with another candidate' preview line.")
+    if matched & _MASCOT_DEV_WORDS:
+        ideas.append("Exhausted developer with red eyes, hoodie, laptop, and a pizza slice shaped like a middle finger.")
+        ideas.append("Pixel‑art dev sitting on a stack of bug reports with coffee IV drip.")
+    if matched & _MASCOT_VISA_WORDS:
+        ideas.append("A long snake‑like queue of tiny characters, one waving a passport and looking exhausted.")
+        ideas.append("A passport character stuck inside an hourglass with sand running out.")
+    if matched & _MASCOT_BURNOUT_WORDS:
+        ideas.append("Human‑shaped battery at 3% charge, plugged into a coffee mug like a power adapter.")
+    if matched & _MASCOT_BUTT_WORDS:
+        ideas.append("A cartoon butt with a tiny bandage and a 'Work Broke Me' tattoo.")
+    if not ideas:
+        ideas.append("Pick a simple archetype: worker, applicant, ghost, cop, turtle, whale – then exaggerate it hard.")
+        ideas.append("Design a mascot that could be drawn in 4–5 simple shapes so people can easily remix it.")
+
+    if matched & {"visa", "queue"}:
+        emojis = ["🛂", "🧳", "⏳"]
+    elif matched & {"dev", "developer"}:
+        emojis = ["👨‍💻", "👩‍💻", "☕"]
+    elif "reject" in matched:
+        emojis = ["📩", "❌", "💔"]
+    elif "burnout" in matched:
+        emojis = ["🔋", "😵‍💫", "☕"]
+    else:
+        emojis = ["🧠", "🔥", "🎭"]
+
+    return ideas, emojis
+
+
+# ---------- VAULT TABLE HELPERS ----------
+def vault_signature(ideas):
+    # Cheap hashable key for st.cache_data. Every mutation writes through
+    # to disk immediately, so the file's nanosecond mtime changes on each
+    # save — unlike the entry timestamps, whose one-second resolution let
+    # two quick re-saves share a key and serve the first save's scores
+    # from cache. len(ideas) stays in as a belt-and-braces guard.
+    try:
+        mtime_ns = os.stat(IDEAS_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return (len(ideas), mtime_ns)
+
+
+@cache
+def _tier_dtype():
+    import pandas as pd
+
+    # Only 5 possible tiers: categorical storage keeps the column as
+    # small int codes and makes value_counts a plain bincount. "Unknown"
+    # catches migrated entries whose tier is missing or from an old
+    # labelling scheme — without it they'd turn into NaN and vanish from
+    # the distribution chart.
+    return pd.CategoricalDtype(
+        categories=["Unknown", *reversed(_TIERS)], ordered=True
+    )
+
+
+@st.cache_data(show_spinner=False)
+def build_vault_df(sig, _ideas):
+    import pandas as pd
+
+    # Columnar construction: each column buffer is allocated once instead
+    # of pandas transposing N per-row dicts and inferring dtypes per row.
+    totals = np.array([i.get("total_score", 0) for i in _ideas], dtype=np.int16)
+    df = pd.DataFrame({
+        "Name": [i["name"] for i in _ideas],
+        "Ticker": [i.get("ticker", "") for i in _ideas],
+        "Total Score": totals,
+        "Tier": pd.array(
+            [t if t in _TIERS else "Unknown" for t in (i.get("tier") for i in _ideas)],
+            dtype=_tier_dtype(),
+        ),
+        "Meme Readiness": [i.get("meme_readiness", 0) for i in _ideas],
+        "Saved At": [i.get("timestamp", "") for i in _ideas],
+    })
+    # Descending stable order via argsort on the raw int column, skipping
+    # pandas' general sort_values machinery.
+    order = np.argsort(-totals, kind="stable")
+    return df.take(order).reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False)
+def vault_csv_bytes(sig, _df):
+    return _df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def vault_pretty_json(sig, _ideas):
+    # Underscore-prefixed fields (_key, …) are storage internals, not
+    # part of the exported schema.
+    public = [
+        {k: v for k, v in idea.items() if not k.startswith("_")} for idea in _ideas
+    ]
+    return json.dumps(public, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def tier_distribution(sig, _ideas):
+    return build_vault_df(sig, _ideas)["Tier"].value_counts()
+
+
+# ---------- SESSION STATE ----------
+def rebuild_name_index():
+    # Entries saved by recent versions carry their normalized name in
+    # "_key"; only older entries need re-normalizing here. idea_names is
+    # the display-order name list every tab's selectbox reads, kept here
+    # so reruns don't re-derive it N times.
+    st.session_state.name_index = {
+        idea.get("_key") or idea["name"].strip().lower(): i
+        for i, idea in enumerate(st.session_state.ideas)
+    }
+    st.session_state.idea_names = [idea["name"] for idea in st.session_state.ideas]
+
+
+if "ideas" not in st.session_state:
+    st.session_state.ideas = load_ideas()
+    rebuild_name_index()
+
+
+def find_idea_by_name(name: str):
+    idx = st.session_state.name_index.get(name.strip().lower())
+    return st.session_state.ideas[idx] if idx is not None else None
+
+
+# ---------- LAYOUT: TABS ----------
+st.title("💊 Meme Coin Launch Studio")
+st.caption("Score, store, compare, and prepare degen‑ready meme coins with a 40‑point model + launch tools.")
+
+tabs = st.tabs([
+    "Score Idea",
+    "Idea Vault",
+    "Comparison Dashboard",
+    "Launch Checklist",
+    "Generators",
+    "Settings",
+])
+
+# ---------- TAB 1: SCORE IDEA ----------
+with tabs[0]:
+    st.header("Score a meme coin idea")
+
+    col_left, col_right = st.columns([2, 1])
+
+    # A queued prefill (sample/vault load) must land in session state
+    # before the widgets below are instantiated, or Streamlit ignores it.
+    prefill = st.session_state.pop("prefill_idea", None)
+    if prefill:
+        st.session_state["idea_name_input"] = prefill["name"]
+        st.session_state["idea_ticker_input"] = prefill["ticker"]
+        st.session_state["idea_narrative_input"] = prefill["narrative"]
+
+    with col_left:
+        st.subheader("Idea details")
+
+        # Text inputs trigger a full script rerun on every keystroke when
+        # left bare; batching them in a form means one rerun per apply.
+        with st.form("idea_form"):
+            idea_name = st.text_input(
+                "Idea name",
+                placeholder="e.g., Rejected Applicant Coin",
+                key="idea_name_input",
+            )
+            ticker = st.text_input(
+                "Ticker", placeholder="e.g., $REKTAPP", key="idea_ticker_input"
+            )
+            narrative = st.text_area(
+                "Core narrative (1–3 paragraphs)",
+                placeholder="Describe the story, pain, or joke behind this coin.",
+                height=200,
+                key="idea_narrative_input",
+            )
+
+            auto_mode = st.checkbox("Auto‑score this idea (reduce manual bias)", value=True)
+            st.form_submit_button("Apply idea details")
+        st.caption("You can still adjust scores manually if you want fine‑tuning.")
+
+    with col_right:
+        st.subheader("Optional: start from a sample")
+        preset = st.selectbox("Sample ideas", ["None"] + list(SAMPLE_IDEAS))
+        if preset != "None":
+            sample = SAMPLE_IDEAS[preset]
+            st.caption(f"{preset} ({sample['ticker']})")
+            st.caption(sample["narrative"])
+            if st.button("Use this sample"):
+                st.session_state["prefill_idea"] = {
+                    "name": preset,
+                    "ticker": sample["ticker"],
+                    "narrative": sample["narrative"],
+                }
+                st.experimental_rerun()
+
+        st.subheader("Optional: load existing idea")
+        all_names = st.session_state.idea_names
+        if all_names:
+            selected_existing = st.selectbox("Load idea from vault", ["None"] + all_names)
+            if selected_existing != "None":
+                existing = find_idea_by_name(selected_existing)
+                if existing:
+                    if st.button("Load selected idea here"):
+                        idea_name = existing["name"]
+                        ticker = existing.get("ticker", "")
+                        narrative = existing.get("narrative", "")
+                        st.experimental_rerun()
+
+    st.markdown("---")
+
+    # Auto or manual score defaults
+    if auto_mode:
+        default_scores = heuristic_auto_score(idea_name, narrative)
+    else:
+        default_scores = dict.fromkeys(CRITERIA, 3)
+
+    # Show sliders with prefilled scores (for optional tweak)
+    st.subheader("Scoring (0–5 per criterion)")
+    st.caption("Adjust only if you strongly disagree with the auto‑score.")
+
+    # Sliders live in a form so dragging them doesn't rerun the whole
+    # script on every tick – one rerun per "Compute score" click instead.
+    with st.form("score_form"):
+        cols = st.columns(2)
+        with cols[0]:
+            concept_clarity = st.slider(
+                "Concept Clarity – Understandable in 3 seconds?",
+                0, 5, default_scores["Concept Clarity"],
+            )
+            remixability = st.slider(
+                "Remixability – Easy to create variations and running jokes?",
+                0, 5, default_scores["Remixability"],
+            )
+            cultural_bandwidth = st.slider(
+                "Cultural Bandwidth – Works across countries and cultures?",
+                0, 5, default_scores["Cultural Bandwidth"],
+            )
+            reply_bait = st.slider(
+                "Reply‑Bait Potential – Naturally invites replies, stories, cope?",
+                0, 5, default_scores["Reply‑Bait Potential"],
+            )
+        with cols[1]:
+            conflict_tension = st.slider(
+                "Conflict / Tension – Clear ‘versus’ dynamic?",
+                0, 5, default_scores["Conflict / Tension"],
+            )
+            status_signaling = st.slider(
+                "Status Signaling – Says something about the holder?",
+                0, 5, default_scores["Status Signaling"],
+            )
+            narrative_hook = st.slider(
+                "Narrative Hook – Strong one‑liner potential?",
+                0, 5, default_scores["Narrative Hook"],
+            )
+            character_strength = st.slider(
+                "Character / Symbol Strength – Strong icon, mascot, or symbol?",
+                0, 5, default_scores["Character / Symbol Strength"],
+            )
+
+        st.form_submit_button("Compute score")
+
+    score_values = (
+        concept_clarity, remixability, cultural_bandwidth, reply_bait,
+        conflict_tension, status_signaling, narrative_hook, character_strength,
+    )
+    # Sum the tuple directly; the name->score dict is only built where
+    # downstream code actually needs named access.
+    total_score = (
+        concept_clarity + remixability + cultural_bandwidth + reply_bait
+        + conflict_tension + status_signaling + narrative_hook + character_strength
+    )
+    scores = dict(zip(CRITERIA, score_values))
+    tier = rate_score(total_score)
+    tier_text = tier_description(tier)
+    readiness = compute_meme_readiness(scores)
+
+    st.markdown("---")
+    st.subheader("Results")
+
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        st.metric("Total score", f"{total_score} / 40")
+    with col_b:
+        st.metric("Tier", tier)
+    with col_c:
+        st.metric("Meme‑readiness", f"{readiness} / 100")
+
+    st.write(tier_text)
+
+    with st.expander("See detailed breakdown"):
+        # One markdown element instead of 8 separate frontend messages.
+        st.markdown("\n".join(f"- **{k}:** {v} / 5" for k, v in scores.items()))
+
+    # Suggestions
+    st.subheader("Suggestions based on weak dimensions")
+    weak_dims = [k for k, v in scores.items() if v <= 2]
+    if not weak_dims:
+        st.write("This idea looks structurally solid. Focus on launch timing, distribution, and execution.")
+    else:
+        st.markdown("\n".join(SUGGESTIONS[dim] for dim in weak_dims))
+
+    st.markdown("---")
+    st.subheader("Save this idea to your vault")
+
+    notes = st.text_area(
+        "Notes (optional)",
+        placeholder="Launch thoughts, variations to test, influencer angles, etc.",
+        height=120,
+    )
+
+    if st.button("Save / Update Idea"):
+        if not idea_name:
+            st.warning("You need at least an idea name to save.")
+        else:
+            timestamp = utc_timestamp()
+            new_entry = {
+                "name": idea_name,
+                "_key": idea_name.strip().lower(),
+                "ticker": ticker,
+                "narrative": narrative,
+                "scores": scores,
+                "total_score": total_score,
+                "tier": tier,
+                "meme_readiness": readiness,
+                "notes": notes,
+                "timestamp": timestamp,
+                "checklist": {},  # will be filled in Launch Checklist tab
+            }
+
+            # Update or append via the O(1) name index
+            key = idea_name.strip().lower()
+            idx = st.session_state.name_index.get(key)
+            if idx is not None:
+                idea = st.session_state.ideas[idx]
+                st.session_state.ideas[idx] = {
+                    **idea,
+                    **new_entry,
+                    "checklist": idea.get("checklist", {}),
+                }
+                st.session_state.idea_names[idx] = new_entry["name"]
+                append_idea(st.session_state.ideas[idx])
+            else:
+                st.session_state.ideas.append(new_entry)
+                st.session_state.name_index[key] = len(st.session_state.ideas) - 1
+                st.session_state.idea_names.append(new_entry["name"])
+                append_idea(new_entry)
+            st.success("Idea saved / updated in vault.")
+
+
+# ---------- TAB 2: IDEA VAULT ----------
+with tabs[1]:
+    st.header("Idea vault")
+
+    ideas = st.session_state.ideas
+    if not ideas:
+        st.info("No ideas saved yet. Use the 'Score Idea' tab to add one.")
+    else:
+        df_sorted = build_vault_df(vault_signature(ideas), ideas)
+        st.dataframe(df_sorted, use_container_width=True)
+
+        st.markdown("#### Clone or edit an idea")
+        selected_name = st.selectbox("Select idea", df_sorted["Name"].tolist())
+        selected_idea = find_idea_by_name(selected_name)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Load into Score tab"):
+                st.session_state["load_name"] = selected_name
+                st.info("Go back to 'Score Idea' tab and use the dropdown to load it.")
+            if st.button("Clone idea"):
+                if selected_idea:
+                    clone = selected_idea.copy()
+                    clone["name"] = selected_idea["name"] + " (Clone)"
+                    clone["_key"] = clone["name"].strip().lower()
+                    clone["timestamp"] = utc_timestamp()
+                    st.session_state.ideas.append(clone)
+                    st.session_state.name_index[clone["_key"]] = len(st.session_state.ideas) - 1
+                    st.session_state.idea_names.append(clone["name"])
+                    append_idea(clone)
+                    st.success("Idea cloned.")
+        with col2:
+            if st.button("Delete idea"):
+                st.session_state.ideas = [i for i in st.session_state.ideas if i["name"] != selected_name]
+                rebuild_name_index()
+                rewrite_ideas(st.session_state.ideas)
+                st.success("Idea deleted.")
+                st.experimental_rerun()
+
+        st.markdown("#### Edit notes for selected idea")
+        if selected_idea:
+            current_notes = selected_idea.get("notes", "")
+            updated_notes = st.text_area(
+                "Notes",
+                value=current_notes,
+                height=150,
+            )
+            if st.button("Save notes"):
+                for i, idea in enumerate(st.session_state.ideas):
+                    if idea["name"] == selected_name:
+                        st.session_state.ideas[i]["notes"] = updated_notes
+                        append_idea(st.session_state.ideas[i])
+                        break
+                st.success("Notes updated.")
+
+        # Download
+        csv = vault_csv_bytes(vault_signature(ideas), df_sorted)
+        st.download_button(
+            label="⬇️ Download vault as CSV",
+            data=csv,
+            file_name="meme_coin_ideas_vault.csv",
+            mime="text/csv",
+        )
+
+
+# ---------- TAB 3: COMPARISON DASHBOARD ----------
+with tabs[2]:
+    st.header("Comparison dashboard")
+
+    ideas = st.session_state.ideas
+    if len(ideas) < 2:
+        st.info("Save at least two ideas to compare them.")
+    else:
+        import pandas as pd
+
+        names = st.session_state.idea_names
+        selected_names = st.multiselect("Select ideas to compare", names, default=names[:3])
+
+        selected_ideas = [i for i in ideas if i["name"] in selected_names]
+
+        if selected_ideas:
+            comp_df = pd.DataFrame([
+                {
+                    "Name": i["name"],
+                    "Total Score": i.get("total_score", 0),
+                    "Meme Readiness": i.get("meme_readiness", 0),
+                }
+                for i in selected_ideas
+            ])
+            st.subheader("Total score vs meme‑readiness")
+            st.bar_chart(comp_df.set_index("Name"))
+
+            # Radar: 8 dimensions
+            st.subheader("Criteria breakdown (radar‑style table)")
+
+            # Hand pandas one typed (K, 8) array instead of K per-row
+            # dicts – no per-cell boxing or dtype inference.
+            radar_matrix = scores_matrix(selected_ideas)
+            radar_df = pd.DataFrame(
+                radar_matrix,
+                columns=list(CRITERIA),
+                index=pd.Index([i["name"] for i in selected_ideas], name="Name"),
+            )
+            st.dataframe(radar_df, use_container_width=True)
+
+            with st.expander("What‑if: re-weight meme‑readiness"):
+                st.caption("Recompute readiness for the selected ideas with your own bucket weights.")
+                w_se = st.slider("Social energy weight", 0.0, 1.0, 0.4, 0.05)
+                w_mf = st.slider("Meme fundamentals weight", 0.0, 1.0, 0.3, 0.05)
+                w_aa = st.slider("Attention anchors weight", 0.0, 1.0, 0.3, 0.05)
+                whatif = compute_meme_readiness_batch(radar_matrix, w_se, w_mf, w_aa)
+                totals = radar_matrix.sum(axis=1)
+                whatif_df = pd.DataFrame({
+                    "Name": [i["name"] for i in selected_ideas],
+                    "Total Score": totals,
+                    "Tier": rate_scores_batch(totals),
+                    "Stored Readiness": [i.get("meme_readiness", 0) for i in selected_ideas],
+                    "What‑if Readiness": whatif,
+                })
+                st.dataframe(whatif_df.set_index("Name"), use_container_width=True)
+
+            st.subheader("Tier distribution")
+            tier_counts = tier_distribution(vault_signature(ideas), ideas)
+            st.bar_chart(tier_counts)
+
+
+# ---------- TAB 4: LAUNCH CHECKLIST ----------
+with tabs[3]:
+    st.header("Launch checklist")
+
+    ideas = st.session_state.ideas
+    if not ideas:
+        st.info("Save at least one idea first.")
+    else:
+        name_for_checklist = st.selectbox(
+    "Select idea",
+    st.session_state.idea_names,
+    key="checklist_select"
+)
+
+        idea = find_idea_by_name(name_for_checklist)
+
+        if idea:
+            default_checklist = {
+                "Narrative finalized": False,
+                "Mascot selected": False,
+                "Reply rituals defined": False,
+                "First 10 posts drafted": False,
+                "Pump.fun description ready": False,
+                "Meme templates created": False,
+                "Launch timing decided": False,
+                "Seeding / influencer plan": False,
+                "Pinned post / announcement ready": False,
+            }
+            cl = idea.get("checklist", {})
+            # merge with defaults
+            for k, v in default_checklist.items():
+                cl.setdefault(k, v)
+
+            st.subheader(f"Checklist for {name_for_checklist}")
+            new_cl = {}
+            cols = st.columns(2)
+            items = list(cl.items())
+            half = len(items) // 2 + len(items) % 2
+
+            with cols[0]:
+                for k, v in items[:half]:
+                    new_cl[k] = st.checkbox(k, value=v)
+            with cols[1]:
+                for k, v in items[half:]:
+                    new_cl[k] = st.checkbox(k, value=v)
+
+            if st.button("Save checklist"):
+                for i, obj in enumerate(st.session_state.ideas):
+                    if obj["name"] == name_for_checklist:
+                        st.session_state.ideas[i]["checklist"] = new_cl
+                        append_idea(st.session_state.ideas[i])
+                        break
+                st.success("Checklist updated.")
+
+
+# ---------- TAB 5: GENERATORS ----------
+with tabs[4]:
+    st.header("Generators")
+
+    ideas = st.session_state.ideas
+    col_gen1, col_gen2 = st.columns(2)
+
+    with col_gen1:
+        st.subheader("Pump.fun description generator")
+        source_idea_name = st.selectbox(
+            "Select idea for description",
+            ["Custom narrative"] + st.session_state.idea_names,
+        )
+
+        if source_idea_name == "Custom narrative":
+            d_name = st.text_input("Idea name (for description)", "")
+            d_ticker = st.text_input("Ticker (for description)", "")
+            d_narr = st.text_area("Narrative", "", height=150)
+        else:
+            idea = find_idea_by_name(source_idea_name)
+            d_name = idea["name"]
+            d_ticker = idea.get("ticker", "")
+            d_narr = idea.get("narrative", "")
+
+        if st.button("Generate descriptions"):
+            descs = generate_pumpfun_descriptions(d_name, d_ticker, d_narr)
+            for k, v in descs.items():
+                st.markdown(f"**{k} version:**")
+                st.code(v)
+
+    with col_gen2:
+        st.subheader("Mascot suggestion generator")
+        source_mascot_name = st.selectbox(
+            "Select idea for mascot",
+            ["Custom"] + st.session_state.idea_names,
+        )
+
+        if source_mascot_name == "Custom":
+            m_name = st.text_input("Idea name (for mascot)", "")
+            m_narr = st.text_area("Narrative (for mascot)", "", height=150)
+        else:
+            idea = find_idea_by_name(source_mascot_name)
+            m_name = idea["name"]
+            m_narr = idea.get("narrative", "")
+
+        if st.button("Generate mascot suggestions"):
+            concepts, emojis = generate_mascot_suggestions(m_name, m_narr)
+            st.markdown("**Concept ideas:**")
+            for c in concepts:
+                st.write(f"- {c}")
+            st.markdown("**Emoji palette ideas:**")
+            st.write(" ".join(emojis))
+
+
+# ---------- TAB 6: SETTINGS ----------
+with tabs[5]:
+    st.header("Settings")
+
+    st.write("Manage stored data and basic configuration.")
+
+    # Human-readable export lives here so the on-disk format can stay
+    # compact; pretty-printing roughly doubles bytes and parse time.
+    # The signature is mtime-based, so notes/checklist edits refresh
+    # the export too.
+    st.download_button(
+        label="⬇️ Export vault as pretty JSON",
+        data=vault_pretty_json(vault_signature(st.session_state.ideas), st.session_state.ideas),
+        file_name="meme_coin_ideas_vault.json",
+        mime="application/json",
+    )
+
+    if st.button("Reset vault (delete all ideas)"):
+        st.warning("This will delete all saved ideas and cannot be undone.")
+        st.session_state.ideas = []
+        rebuild_name_index()
+        rewrite_ideas([])
+        st.success("Vault cleared. Restart the app to see it empty.")
+
+    st.write("Ideas are stored locally in `ideas.jsonl` in the same folder as this script.")